@@ -5,17 +5,43 @@ Generate DXF labels for cable tagging from CSV schedule
 """
 
 import csv
+import io
 import os
+import re
 import sys
 import argparse
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
 from dataclasses import dataclass
+from functools import lru_cache, partial
 from typing import List, Tuple, Optional
+import chardet
 import ezdxf
 from ezdxf import units
+from ezdxf.addons import r12writer
 
+# Keywords that mark the first CSV line as a header (single scan, compiled once)
+_HEADER_RE = re.compile(r'cable|id|origin|destination|spec', re.IGNORECASE)
 
-@dataclass
+# Specification format: "500mm² 110 XLPE CU FLEX 20-OF" - an optional
+# leading size token containing "mm", the rest is the type. DOTALL so a
+# quoted multi-line CSV field still matches (it can never fail to match).
+_SPEC_RE = re.compile(r'^\s*(\S*mm\S*)?\S*\s*(.*)$', re.DOTALL)
+
+# Shared text attribute dicts for the R2010 document path - the entries
+# only differ in the insert point, which set_placement supplies per label
+_TEXT_CENTER_ATTRS = {
+    "layer": "Text",
+    "halign": ezdxf.const.CENTER,
+    "valign": ezdxf.const.MIDDLE
+}
+_TEXT_LEFT_ATTRS = {
+    "layer": "Text",
+    "valign": ezdxf.const.MIDDLE
+}
+
+
+@dataclass(slots=True)
 class CableData:
     """Cable data structure"""
     cable_id: str
@@ -24,23 +50,139 @@ class CableData:
     destination: str
     size: str = ""
     type: str = ""
-    
+
     def __post_init__(self):
-        # Parse specification to extract size and type
-        # Format: "500mm² 110 XLPE CU FLEX 20-OF"
-        spec_parts = self.specification.split()
-        if spec_parts:
-            # First part is usually size like "500mm²"
-            self.size = spec_parts[0] if 'mm' in spec_parts[0] else ""
-            # Rest is type
-            self.type = ' '.join(spec_parts[1:]) if len(spec_parts) > 1 else ""
+        # Parse specification to extract size and type in one scan
+        m = _SPEC_RE.match(self.specification)
+        self.size = m.group(1) or ""
+        # Collapse whitespace runs like the old ' '.join(split()) did
+        self.type = ' '.join(m.group(2).split())
+
+
+@lru_cache(maxsize=None)
+def _label_geometry(label_width: float, label_height: float):
+    """Outline and hole polylines for a label size (computed once per size)"""
+
+    # Label outline (cutting line)
+    outline = (
+        (0, 0),
+        (label_width, 0),
+        (label_width, label_height),
+        (0, label_height),
+        (0, 0)
+    )
+
+    # Mounting holes (4 corners, 5mm from edges)
+    hole_offset = 5
+    hole_width = 5   # mm
+    hole_height = 2.5  # mm
+    hole_positions = [
+        (hole_offset, hole_offset),
+        (label_width - hole_offset, hole_offset),
+        (hole_offset, label_height - hole_offset),
+        (label_width - hole_offset, label_height - hole_offset)
+    ]
+
+    # Rectangle holes (5mm x 2.5mm)
+    holes = tuple(
+        (
+            (hx - hole_width/2, hy - hole_height/2),
+            (hx + hole_width/2, hy - hole_height/2),
+            (hx + hole_width/2, hy + hole_height/2),
+            (hx - hole_width/2, hy + hole_height/2),
+            (hx - hole_width/2, hy - hole_height/2)
+        )
+        for hx, hy in hole_positions
+    )
+    return outline, holes
+
+
+def _write_label_dxf(output_path: str, cable: CableData,
+                     label_width: float, label_height: float):
+    """Write a single label DXF to output_path"""
+
+    outline, holes = _label_geometry(label_width, label_height)
+
+    # Stream entities straight to the file with the R12 fast writer -
+    # no in-memory document, layer tables or handle allocation needed.
+    # Coordinates are in millimeters.
+    with r12writer(output_path) as w:
+        # Bind the writer methods once instead of one attribute lookup
+        # per entity
+        add_polyline_2d = w.add_polyline_2d
+        add_text = w.add_text
+
+        add_polyline_2d(outline, closed=True, layer="Cutting", color=4)
+
+        for hole_points in holes:
+            add_polyline_2d(hole_points, closed=True, layer="Hole", color=1)
+
+        # Add text - Layout matching MLA sample DXF style (180mm x 45mm)
+        text_margin = 5
+
+        # Cable ID (top, larger font, centered)
+        add_text(
+            cable.cable_id,
+            insert=(label_width/2, label_height - 12),
+            height=7,
+            align="MIDDLE_CENTER",
+            layer="Text",
+            color=5
+        )
+
+        # Specification (below cable ID) - wider label allows longer text
+        spec_text = cable.specification[:55]
+        add_text(
+            spec_text,
+            insert=(label_width/2, label_height - 22),
+            height=4,
+            align="MIDDLE_CENTER",
+            layer="Text",
+            color=5
+        )
+
+        # Origin (left aligned, bottom section) - wider label allows longer text
+        if cable.origin:
+            origin_short = cable.origin[:45]
+            add_text(
+                f"ORIGIN: {origin_short}",
+                insert=(text_margin, 14),
+                height=3.5,
+                align="MIDDLE_LEFT",
+                layer="Text",
+                color=5
+            )
+
+        # Destination (left aligned, below origin)
+        if cable.destination:
+            dest_short = cable.destination[:45]
+            add_text(
+                f"DEST: {dest_short}",
+                insert=(text_margin, 7),
+                height=3.5,
+                align="MIDDLE_LEFT",
+                layer="Text",
+                color=5
+            )
+
+
+def _render_one(cable: CableData, output_dir: str,
+                label_width: float = 80, label_height: float = 40) -> str:
+    """Render one individual label (module-level so it pickles for worker processes)"""
+    filename = f"cable_{cable.cable_id.replace('/', '_')}.dxf"
+    output_path = os.path.join(output_dir, filename)
+    _write_label_dxf(output_path, cable, label_width, label_height)
+    return output_path
 
 
 class CableLabelGenerator:
     """Generate DXF cable labels from CSV data"""
     
-    def __init__(self, output_dir: str = "output"):
+    def __init__(self, output_dir: str = "output", dxf_version: str = "R12"):
         self.output_dir = output_dir
+        # "R12" streams sheets through the fast writer; "R2010" builds a
+        # full ezdxf document for callers that need modern DXF features
+        self.dxf_version = dxf_version
         self.canvas_width = 600  # mm
         self.canvas_height = 300  # mm
         
@@ -50,39 +192,64 @@ class CableLabelGenerator:
         
         # Ensure output directory exists
         os.makedirs(output_dir, exist_ok=True)
+
+        # The R2010 document path is much slower without ezdxf's optional
+        # C-extensions (pure-Python fallback when built from source)
+        if self.dxf_version != "R12" and not ezdxf.options.use_c_ext:
+            print("⚠ ezdxf C-extensions not active - R2010 output will be "
+                  "slow. Reinstall ezdxf from a binary wheel "
+                  "(pip install --force-reinstall ezdxf).")
     
-    def parse_csv(self, csv_path: str) -> List[CableData]:
-        """Parse CSV file and return list of CableData"""
+    def parse_csv(self, csv_path: str,
+                  max_cables: Optional[int] = None) -> List[CableData]:
+        """Parse CSV file and return list of CableData
+
+        If max_cables is given, parsing stops as soon as that many
+        cables have been collected.
+        """
         cables = []
-        
-        # Detect encoding
-        encodings = ['utf-8', 'utf-8-sig', 'latin-1', 'cp1252']
-        
-        for encoding in encodings:
-            try:
-                with open(csv_path, 'r', encoding=encoding) as f:
-                    # Try to detect if there's a header
-                    sample = f.read(1024)
-                    f.seek(0)
-                    
-                    # Check if first line looks like header
-                    first_line = sample.split('\n')[0] if sample else ""
-                    has_header = any(keyword in first_line.lower() for keyword in 
-                                   ['cable', 'id', 'origin', 'destination', 'spec'])
-                    
-                    reader = csv.reader(f)
-                    
+
+        # Open once in binary with a 1 MiB buffer and stream rows through
+        # a TextIOWrapper, so large schedules are never fully materialized;
+        # the first 64 KiB double as the encoding/header sniff sample
+        with open(csv_path, 'rb', buffering=1 << 20) as raw:
+            sample = raw.read(65536)
+
+            detected = chardet.detect(sample)
+            encodings = ['utf-8-sig', 'latin-1', 'cp1252']
+            if detected['encoding'] and detected['confidence'] >= 0.5:
+                # Try the detected encoding first but keep the cascade as
+                # a fallback: a confident detection of the sample can still
+                # fail on bytes past the sniff window
+                enc = detected['encoding'].lower()
+                encodings = [enc] + [e for e in encodings if e != enc]
+
+            # Check if first line looks like header (the keywords are
+            # ASCII, so latin-1 decodes them under any candidate encoding)
+            first_line = sample.split(b'\n', 1)[0].decode('latin-1')
+            has_header = bool(_HEADER_RE.search(first_line))
+
+            for encoding in encodings:
+                raw.seek(0)
+                # Built inside the try: chardet can report encodings
+                # Python has no codec for, which raises LookupError here
+                text = None
+                try:
+                    text = io.TextIOWrapper(raw, encoding=encoding,
+                                            newline='')
+                    reader = csv.reader(text)
+
                     # Skip header if exists
                     if has_header:
                         next(reader)
-                    
+
                     for row in reader:
                         if len(row) >= 4:
                             cable = CableData(
                                 cable_id=row[0].strip(),
                                 specification=row[1].strip(),
-                                origin=row[2].strip().replace('ORIGIN: ', ''),
-                                destination=row[3].strip().replace('DESTINATION: ', '')
+                                origin=row[2].strip().removeprefix('ORIGIN: '),
+                                destination=row[3].strip().removeprefix('DESTINATION: ')
                             )
                             if cable.cable_id:  # Only add if has ID
                                 cables.append(cable)
@@ -96,256 +263,302 @@ class CableLabelGenerator:
                             )
                             if cable.cable_id:
                                 cables.append(cable)
-                break
-            except UnicodeDecodeError:
-                continue
-            except Exception as e:
-                print(f"Error reading with {encoding}: {e}")
-                continue
-        
+                        if max_cables is not None and len(cables) >= max_cables:
+                            break
+                    break
+                except UnicodeDecodeError:
+                    cables.clear()
+                    continue
+                except Exception as e:
+                    print(f"Error reading with {encoding}: {e}")
+                    cables.clear()
+                    continue
+                finally:
+                    # Keep the binary stream usable for a retry with the
+                    # next candidate encoding
+                    if text is not None:
+                        text.detach()
+
         return cables
     
-    def create_label_dxf(self, cable: CableData, filename: str, 
+    def create_label_dxf(self, cable: CableData, filename: str,
                          label_width: float = 80, label_height: float = 40) -> str:
         """Create single label DXF file"""
-        
-        doc = ezdxf.new('R2010')  # AutoCAD 2010+ compatible
-        msp = doc.modelspace()
-        
-        # Set units to millimeters
-        doc.units = units.MM
-        
-        # Create layers
-        doc.layers.add("Cutting", color=4)   # Cyan
-        doc.layers.add("Hole", color=1)      # Red
-        doc.layers.add("Text", color=5)      # Blue
-        
-        # Draw label outline (cutting line)
-        points = [
-            (0, 0),
-            (label_width, 0),
-            (label_width, label_height),
-            (0, label_height),
-            (0, 0)
-        ]
-        msp.add_lwpolyline(points, close=True, dxfattribs={"layer": "Cutting"})
-        
-        # Add mounting holes (4 corners, 5mm from edges)
-        hole_offset = 5
-        hole_width = 5   # mm
-        hole_height = 2.5  # mm
-        hole_positions = [
-            (hole_offset, hole_offset),
-            (label_width - hole_offset, hole_offset),
-            (hole_offset, label_height - hole_offset),
-            (label_width - hole_offset, label_height - hole_offset)
+
+        output_path = os.path.join(self.output_dir, filename)
+        _write_label_dxf(output_path, cable, label_width, label_height)
+        return output_path
+    
+    def create_multi_label_sheet(self, cables: List[CableData], filename: str,
+                                  labels_per_row: int = 6, 
+                                  label_width: float = 80,
+                                  label_height: float = 40,
+                                  spacing: float = 2) -> str:
+        """Create multi-label sheet arranged in grid"""
+
+        if self.dxf_version != "R12":
+            return self._create_multi_label_sheet_r2010(
+                cables, filename, labels_per_row,
+                label_width, label_height, spacing
+            )
+
+        # Calculate layout
+        total_width = labels_per_row * (label_width + spacing) + spacing
+        rows_needed = (len(cables) + labels_per_row - 1) // labels_per_row
+        total_height = rows_needed * (label_height + spacing) + spacing
+
+        print(f"Creating sheet: {total_width:.0f}mm x {total_height:.0f}mm")
+        print(f"Labels: {len(cables)} arranged in {rows_needed} rows x {labels_per_row} cols")
+
+        output_path = os.path.join(self.output_dir, filename)
+
+        # Geometry templates: corner offsets relative to the label origin,
+        # cached per label size and shared by every sheet of the run
+        outline_template, hole_templates = _label_geometry(
+            label_width, label_height)
+
+        # Precompute the grid slot origins in one pass instead of
+        # re-deriving row/col arithmetic inside the draw loop
+        positions = [
+            (spacing + col * (label_width + spacing),
+             total_height - (row + 1) * (label_height + spacing))
+            for row, col in (divmod(idx, labels_per_row)
+                             for idx in range(len(cables)))
         ]
 
-        for hx, hy in hole_positions:
-            # Draw rectangle hole (5mm x 2.5mm)
-            hole_points = [
-                (hx - hole_width/2, hy - hole_height/2),
-                (hx + hole_width/2, hy - hole_height/2),
-                (hx + hole_width/2, hy + hole_height/2),
-                (hx - hole_width/2, hy + hole_height/2),
-                (hx - hole_width/2, hy - hole_height/2)
-            ]
-            msp.add_lwpolyline(hole_points, close=True, dxfattribs={"layer": "Hole"})
-        
-        # Add text - Layout matching MLA sample DXF style (180mm x 45mm)
-        text_margin = 5
-        
-        # Cable ID (top, larger font, centered)
-        msp.add_text(
+        # One streaming writer per sheet, all labels appended to it
+        with r12writer(output_path) as w:
+            for cable, (x_offset, y_offset) in zip(cables, positions):
+                self._draw_label_at_position(
+                    w, cable, x_offset, y_offset,
+                    label_width, label_height,
+                    outline_template, hole_templates
+                )
+
+        return output_path
+
+    def _draw_label_at_position(self, w, cable: CableData,
+                                 x: float, y: float,
+                                 width: float, height: float,
+                                 outline_template: Tuple[Tuple[float, float], ...],
+                                 hole_templates: Tuple[Tuple[Tuple[float, float], ...], ...]):
+        """Draw a single label at specified position"""
+
+        # Bind the writer methods once instead of one attribute lookup
+        # per entity
+        add_polyline_2d = w.add_polyline_2d
+        add_text = w.add_text
+
+        # Outline (template translated to the label position)
+        points = [(px + x, py + y) for px, py in outline_template]
+        add_polyline_2d(points, closed=True, layer="Cutting", color=4)
+
+        # Mounting holes
+        for template in hole_templates:
+            hole_points = [(px + x, py + y) for px, py in template]
+            add_polyline_2d(hole_points, closed=True, layer="Hole", color=1)
+
+        # Text content
+        text_margin = 3
+
+        # Cable ID (centered, large)
+        add_text(
             cable.cable_id,
-            height=7,
-            dxfattribs={
-                "layer": "Text",
-                "style": "STANDARD",
-                "insert": (label_width/2, label_height - 12),
-                "halign": ezdxf.const.CENTER,
-                "valign": ezdxf.const.MIDDLE
-            }
+            insert=(x + width/2, y + height - 12),
+            height=6,
+            align="MIDDLE_CENTER",
+            layer="Text",
+            color=5
         )
-        
-        # Specification (below cable ID) - wider label allows longer text
-        spec_text = cable.specification[:55] if len(cable.specification) > 55 else cable.specification
-        msp.add_text(
-            spec_text,
-            height=4,
-            dxfattribs={
-                "layer": "Text",
-                "insert": (label_width/2, label_height - 22),
-                "halign": ezdxf.const.CENTER,
-                "valign": ezdxf.const.MIDDLE
-            }
+
+        # Specification - wider label allows longer text
+        spec = cable.specification[:50]
+        add_text(
+            spec,
+            insert=(x + width/2, y + height - 22),
+            height=3.5,
+            align="MIDDLE_CENTER",
+            layer="Text",
+            color=5
         )
-        
-        # Origin (left aligned, bottom section) - wider label allows longer text
+
+        # Origin (left aligned, bottom section) - MLA sample style
         if cable.origin:
-            origin_short = cable.origin[:45] if len(cable.origin) > 45 else cable.origin
-            msp.add_text(
+            origin_short = cable.origin[:40]
+            add_text(
                 f"ORIGIN: {origin_short}",
-                height=3.5,
-                dxfattribs={
-                    "layer": "Text",
-                    "insert": (text_margin, 14),
-                    "valign": ezdxf.const.MIDDLE
-                }
+                insert=(x + text_margin, y + 12),
+                height=3.2,
+                align="MIDDLE_LEFT",
+                layer="Text",
+                color=5
             )
-        
+
         # Destination (left aligned, below origin)
         if cable.destination:
-            dest_short = cable.destination[:45] if len(cable.destination) > 45 else cable.destination
-            msp.add_text(
+            dest_short = cable.destination[:40]
+            add_text(
                 f"DEST: {dest_short}",
-                height=3.5,
-                dxfattribs={
-                    "layer": "Text",
-                    "insert": (text_margin, 7),
-                    "valign": ezdxf.const.MIDDLE
-                }
+                insert=(x + text_margin, y + 6),
+                height=3.2,
+                align="MIDDLE_LEFT",
+                layer="Text",
+                color=5
             )
-        
-        # Save file
-        output_path = os.path.join(self.output_dir, filename)
-        doc.saveas(output_path)
-        return output_path
-    
-    def create_multi_label_sheet(self, cables: List[CableData], filename: str,
-                                  labels_per_row: int = 6, 
-                                  label_width: float = 80,
-                                  label_height: float = 40,
-                                  spacing: float = 2) -> str:
-        """Create multi-label sheet arranged in grid"""
-        
+
+    def _create_multi_label_sheet_r2010(self, cables: List[CableData],
+                                         filename: str,
+                                         labels_per_row: int,
+                                         label_width: float,
+                                         label_height: float,
+                                         spacing: float) -> str:
+        """High-level fallback sheet path for AutoCAD 2010+ output"""
+
         doc = ezdxf.new('R2010')
         msp = doc.modelspace()
         doc.units = units.MM
-        
+
         # Create layers
         doc.layers.add("Cutting", color=4)
         doc.layers.add("Hole", color=1)
         doc.layers.add("Text", color=5)
-        
+
         # Calculate layout
         total_width = labels_per_row * (label_width + spacing) + spacing
         rows_needed = (len(cables) + labels_per_row - 1) // labels_per_row
         total_height = rows_needed * (label_height + spacing) + spacing
-        
+
         print(f"Creating sheet: {total_width:.0f}mm x {total_height:.0f}mm")
         print(f"Labels: {len(cables)} arranged in {rows_needed} rows x {labels_per_row} cols")
-        
+
         for idx, cable in enumerate(cables):
             row = idx // labels_per_row
             col = idx % labels_per_row
-            
+
             x_offset = spacing + col * (label_width + spacing)
             y_offset = total_height - (row + 1) * (label_height + spacing)
-            
-            self._draw_label_at_position(
-                msp, cable, x_offset, y_offset, 
+
+            self._draw_label_at_position_r2010(
+                msp, cable, x_offset, y_offset,
                 label_width, label_height
             )
-        
+
         output_path = os.path.join(self.output_dir, filename)
         doc.saveas(output_path)
         return output_path
-    
-    def _draw_label_at_position(self, msp, cable: CableData, 
-                                 x: float, y: float,
-                                 width: float, height: float):
-        """Draw a single label at specified position"""
-        
-        # Outline
-        points = [
-            (x, y),
-            (x + width, y),
-            (x + width, y + height),
-            (x, y + height),
-            (x, y)
-        ]
+
+    def _draw_label_at_position_r2010(self, msp, cable: CableData,
+                                       x: float, y: float,
+                                       width: float, height: float):
+        """Draw a single label into a modelspace at specified position"""
+
+        outline_template, hole_templates = _label_geometry(width, height)
+
+        # Outline (template translated to the label position)
+        points = [(px + x, py + y) for px, py in outline_template]
         msp.add_lwpolyline(points, close=True, dxfattribs={"layer": "Cutting"})
-        
+
         # Mounting holes
-        hole_offset = 5
-        hole_width = 5   # mm
-        hole_height = 2.5  # mm
-        hole_positions = [
-            (x + hole_offset, y + hole_offset),
-            (x + width - hole_offset, y + hole_offset),
-            (x + hole_offset, y + height - hole_offset),
-            (x + width - hole_offset, y + height - hole_offset)
-        ]
-        
-        for hx, hy in hole_positions:
-            # Draw rectangle hole (5mm x 2.5mm)
-            hole_points = [
-                (hx - hole_width/2, hy - hole_height/2),
-                (hx + hole_width/2, hy - hole_height/2),
-                (hx + hole_width/2, hy + hole_height/2),
-                (hx - hole_width/2, hy + hole_height/2),
-                (hx - hole_width/2, hy - hole_height/2)
-            ]
+        for template in hole_templates:
+            hole_points = [(px + x, py + y) for px, py in template]
             msp.add_lwpolyline(hole_points, close=True, dxfattribs={"layer": "Hole"})
-        
+
         # Text content
         text_margin = 3
-        
+
         # Cable ID (centered, large)
         msp.add_text(
             cable.cable_id,
             height=6,
-            dxfattribs={
-                "layer": "Text",
-                "insert": (x + width/2, y + height - 12),
-                "halign": ezdxf.const.CENTER,
-                "valign": ezdxf.const.MIDDLE
-            }
-        )
-        
+            dxfattribs=_TEXT_CENTER_ATTRS
+        ).set_placement((x + width/2, y + height - 12))
+
         # Specification - wider label allows longer text
-        spec = cable.specification[:50] if len(cable.specification) > 50 else cable.specification
+        spec = cable.specification[:50]
         msp.add_text(
             spec,
             height=3.5,
-            dxfattribs={
-                "layer": "Text",
-                "insert": (x + width/2, y + height - 22),
-                "halign": ezdxf.const.CENTER,
-                "valign": ezdxf.const.MIDDLE
-            }
-        )
-        
+            dxfattribs=_TEXT_CENTER_ATTRS
+        ).set_placement((x + width/2, y + height - 22))
+
         # Origin (left aligned, bottom section) - MLA sample style
         if cable.origin:
-            origin_short = cable.origin[:40] if len(cable.origin) > 40 else cable.origin
+            origin_short = cable.origin[:40]
             msp.add_text(
                 f"ORIGIN: {origin_short}",
                 height=3.2,
-                dxfattribs={
-                    "layer": "Text",
-                    "insert": (x + text_margin, y + 12),
-                    "valign": ezdxf.const.MIDDLE
-                }
-            )
-        
+                dxfattribs=_TEXT_LEFT_ATTRS
+            ).set_placement((x + text_margin, y + 12))
+
         # Destination (left aligned, below origin)
         if cable.destination:
-            dest_short = cable.destination[:40] if len(cable.destination) > 40 else cable.destination
+            dest_short = cable.destination[:40]
             msp.add_text(
                 f"DEST: {dest_short}",
                 height=3.2,
-                dxfattribs={
-                    "layer": "Text",
-                    "insert": (x + text_margin, y + 6),
-                    "valign": ezdxf.const.MIDDLE
-                }
+                dxfattribs=_TEXT_LEFT_ATTRS
+            ).set_placement((x + text_margin, y + 6))
+
+    def create_combined_document(self, cables: List[CableData], filename: str,
+                                  labels_per_sheet: int = 18,
+                                  labels_per_row: int = 3,
+                                  label_width: float = 180,
+                                  label_height: float = 45,
+                                  spacing: float = 2) -> str:
+        """Write every label into one DXF instead of one file per sheet
+
+        The default R12 path tiles all sheets into a single continuous
+        grid; the R2010 path keeps the per-sheet grouping by drawing each
+        batch into its own paperspace layout, amortizing the document
+        setup and header once across all cables.
+        """
+
+        if self.dxf_version == "R12":
+            # create_multi_label_sheet streams one grid with as many rows
+            # as needed, which is exactly the stacked-sheets tiling
+            return self.create_multi_label_sheet(
+                cables, filename,
+                labels_per_row=labels_per_row,
+                label_width=label_width,
+                label_height=label_height,
+                spacing=spacing
             )
-    
-    def generate_all_labels(self, csv_path: str, 
+
+        doc = ezdxf.new('R2010')
+        doc.units = units.MM
+
+        # Create layers
+        doc.layers.add("Cutting", color=4)
+        doc.layers.add("Hole", color=1)
+        doc.layers.add("Text", color=5)
+
+        batches = [cables[i:i+labels_per_sheet]
+                   for i in range(0, len(cables), labels_per_sheet)]
+
+        for sheet_num, batch in enumerate(batches, 1):
+            layout = doc.layouts.new(f"Sheet_{sheet_num:02d}")
+
+            rows_needed = (len(batch) + labels_per_row - 1) // labels_per_row
+            total_height = rows_needed * (label_height + spacing) + spacing
+
+            for idx, cable in enumerate(batch):
+                row, col = divmod(idx, labels_per_row)
+                x_offset = spacing + col * (label_width + spacing)
+                y_offset = total_height - (row + 1) * (label_height + spacing)
+
+                self._draw_label_at_position_r2010(
+                    layout, cable, x_offset, y_offset,
+                    label_width, label_height
+                )
+
+        output_path = os.path.join(self.output_dir, filename)
+        doc.saveas(output_path)
+        return output_path
+
+    def generate_all_labels(self, csv_path: str,
                            individual: bool = False,
-                           combined: bool = True) -> List[str]:
+                           combined: bool = True,
+                           single_file: bool = False) -> List[str]:
         """Generate all labels from CSV"""
         
         print(f"\n{'='*60}")
@@ -376,18 +589,34 @@ class CableLabelGenerator:
         # Generate individual labels
         if individual:
             print("Generating individual labels...")
-            for i, cable in enumerate(cables, 1):
-                filename = f"cable_{cable.cable_id.replace('/', '_')}.dxf"
-                filepath = self.create_label_dxf(cable, filename)
-                generated_files.append(filepath)
-                if i % 10 == 0:
-                    print(f"  Progress: {i}/{len(cables)}")
-            print(f"✓ Generated {len(cables)} individual labels\n")
-        
+            # Each label is an independent render + file write, so fan the
+            # work out across cores; chunksize amortizes the IPC pickling.
+            render = partial(_render_one, output_dir=self.output_dir)
+            total = len(cables)
+            with ProcessPoolExecutor() as executor:
+                for i, filepath in enumerate(
+                        executor.map(render, cables, chunksize=16), 1):
+                    generated_files.append(filepath)
+                    # Single rewritten progress line, updated sparingly -
+                    # a print per label would sync the terminal N times
+                    if i % 100 == 0:
+                        sys.stdout.write(f"\r  Progress: {i}/{total}")
+                        sys.stdout.flush()
+            sys.stdout.write(f"\r  Progress: {total}/{total}\n")
+            print(f"✓ Generated {total} individual labels\n")
+        
+        # Generate combined output as a single file
+        if combined and single_file:
+            print("Generating combined label file...")
+            filepath = self.create_combined_document(
+                cables, "cable_labels_all.dxf")
+            generated_files.append(filepath)
+            print(f"  ✓ All {len(cables)} labels in one file\n")
+
         # Generate combined sheets
-        if combined:
+        elif combined:
             print("Generating combined label sheets...")
-            
+
             # Calculate layout for 180mm x 45mm labels on 600x300mm canvas
             # 600 / (180 + 2) = ~3.3 → 3 labels per row
             # 300 / (45 + 2) = ~6.4 → 6 rows
@@ -396,17 +625,24 @@ class CableLabelGenerator:
             batches = [cables[i:i+batch_size] 
                       for i in range(0, len(cables), batch_size)]
             
-            for batch_num, batch in enumerate(batches, 1):
-                filename = f"cable_labels_sheet_{batch_num:02d}.dxf"
-                filepath = self.create_multi_label_sheet(
-                    batch, filename,
-                    labels_per_row=3,
-                    label_width=180,
-                    label_height=45,
-                    spacing=2
-                )
-                generated_files.append(filepath)
-                print(f"  ✓ Sheet {batch_num}: {len(batch)} labels")
+            # Sheets write to separate files, and the dominant cost is
+            # serialization I/O, so overlap them across a few threads
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                futures = [
+                    executor.submit(
+                        self.create_multi_label_sheet,
+                        batch, f"cable_labels_sheet_{batch_num:02d}.dxf",
+                        labels_per_row=3,
+                        label_width=180,
+                        label_height=45,
+                        spacing=2
+                    )
+                    for batch_num, batch in enumerate(batches, 1)
+                ]
+                for batch_num, (batch, future) in enumerate(
+                        zip(batches, futures), 1):
+                    generated_files.append(future.result())
+                    print(f"  ✓ Sheet {batch_num}: {len(batch)} labels")
             
             print(f"✓ Generated {len(batches)} combined sheets\n")
         
@@ -432,18 +668,28 @@ def main():
                        help='Generate individual DXF files for each cable')
     parser.add_argument('--no-combined', action='store_true',
                        help='Skip combined sheets generation')
-    
+    parser.add_argument('--r2010', action='store_true',
+                       help='Write combined sheets as full DXF R2010 documents '
+                            '(default: fast R12 streaming)')
+    parser.add_argument('--single-file', action='store_true',
+                       help='Combine all sheets into one DXF file '
+                            '(with --r2010: one paperspace layout per sheet)')
+
     args = parser.parse_args()
     
     if not os.path.exists(args.csv_file):
         print(f"❌ Error: File not found: {args.csv_file}")
         sys.exit(1)
     
-    generator = CableLabelGenerator(output_dir=args.output)
+    generator = CableLabelGenerator(
+        output_dir=args.output,
+        dxf_version='R2010' if args.r2010 else 'R12'
+    )
     generator.generate_all_labels(
         args.csv_file,
         individual=args.individual,
-        combined=not args.no_combined
+        combined=not args.no_combined,
+        single_file=args.single_file
     )
 
 